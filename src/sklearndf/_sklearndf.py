@@ -237,6 +237,7 @@ class TransformerDF(EstimatorDF, TransformerMixin, metaclass=ABCMeta):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._features_original = None
+        self._features_out = None
 
     @property
     def feature_names_original_(self) -> pd.Series:
@@ -263,7 +264,9 @@ class TransformerDF(EstimatorDF, TransformerMixin, metaclass=ABCMeta):
         transformer
         """
         self._ensure_fitted()
-        return self._get_features_out().rename(self.COL_FEATURE_OUT)
+        if self._features_out is None:
+            self._features_out = self._get_features_out().rename(self.COL_FEATURE_OUT)
+        return self._features_out
 
     # noinspection PyPep8Naming
     @abstractmethod
@@ -9,6 +9,10 @@ native estimators they wrap.
 The wrappers also implement the additional column attributes introduced by `sklearndf`,
 :meth:`~EstimatorDF.feature_names_in_`, :meth:`~TransformerDF.feature_names_out_`, and
 :meth:`~TransformerDF.feature_names_original_`.
+
+The runtime type checks validating the `X` and `y` arguments of every call are guarded
+by ``__debug__``: running Python with the ``-O`` option disables them, removing the
+per-call overhead on hot paths such as cross-validation loops.
 """
 
 import inspect
@@ -150,13 +154,13 @@ class _EstimatorWrapperDF(
         :return: the wrapped data frame estimator
         """
 
-        class _FittedEstimator(cls):
-            def __init__(self) -> None:
-                super().__init__(_delegate_estimator=estimator)
-                self._features_in = features_in
-                self._n_outputs = n_outputs
-
-        return _FittedEstimator()
+        # construct an instance of this wrapper class directly, rather than defining
+        # a throwaway local subclass: local classes cannot be pickled by reference,
+        # and a new class object would be created on every call
+        new_estimator: T_EstimatorWrapperDF = cls(_delegate_estimator=estimator)
+        new_estimator._features_in = features_in
+        new_estimator._n_outputs = n_outputs
+        return new_estimator
 
     def get_params(self, deep=True) -> Mapping[str, Any]:
         """[see superclass]"""
@@ -183,7 +187,8 @@ class _EstimatorWrapperDF(
         self._reset_fit()
 
         try:
-            self._check_parameter_types(X, y)
+            if __debug__:
+                self._check_parameter_types(X, y)
             self._fit(X, y, **fit_params)
             self._post_fit(X, y, **fit_params)
 
@@ -350,7 +355,8 @@ class _TransformerWrapperDF(
     # noinspection PyPep8Naming
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """[see superclass]"""
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         transformed = self._transform(X)
 
@@ -366,7 +372,8 @@ class _TransformerWrapperDF(
         self._reset_fit()
 
         try:
-            self._check_parameter_types(X, y)
+            if __debug__:
+                self._check_parameter_types(X, y)
             transformed = self._fit_transform(X, y, **fit_params)
             self._post_fit(X, y, **fit_params)
 
@@ -385,7 +392,8 @@ class _TransformerWrapperDF(
         """[see superclass]"""
         self._reset_fit()
 
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         transformed = self._inverse_transform(X)
 
@@ -399,6 +407,7 @@ class _TransformerWrapperDF(
             super()._reset_fit()
         finally:
             self._features_original = None
+            self._features_out = None
 
     @staticmethod
     def _transformed_to_df(
@@ -459,7 +468,8 @@ class _LearnerWrapperDF(
         self, X: pd.DataFrame, **predict_params
     ) -> Union[pd.Series, pd.DataFrame]:
         """[see superclass]"""
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         # noinspection PyUnresolvedReferences
         return self._prediction_to_series_or_frame(
@@ -478,7 +488,8 @@ class _LearnerWrapperDF(
         self._reset_fit()
 
         try:
-            self._check_parameter_types(X, y)
+            if __debug__:
+                self._check_parameter_types(X, y)
 
             # noinspection PyUnresolvedReferences
             result = self._prediction_to_series_or_frame(
@@ -505,7 +516,8 @@ class _LearnerWrapperDF(
         self, X: pd.DataFrame, y: pd.Series, sample_weight: Optional[pd.Series] = None
     ) -> float:
         """[see superclass]"""
-        self._check_parameter_types(X, y)
+        if __debug__:
+            self._check_parameter_types(X, y)
         if y is None:
             raise ValueError("arg y must not be None")
         if sample_weight is not None and not isinstance(sample_weight, pd.Series):
@@ -580,7 +592,8 @@ class _ClassifierWrapperDF(
 
         self._ensure_delegate_method("predict_proba")
 
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         # noinspection PyUnresolvedReferences
         return self._prediction_with_class_labels(
@@ -598,7 +611,8 @@ class _ClassifierWrapperDF(
 
         self._ensure_delegate_method("predict_log_proba")
 
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         # noinspection PyUnresolvedReferences
         return self._prediction_with_class_labels(
@@ -616,7 +630,8 @@ class _ClassifierWrapperDF(
 
         self._ensure_delegate_method("decision_function")
 
-        self._check_parameter_types(X, None)
+        if __debug__:
+            self._check_parameter_types(X, None)
 
         # noinspection PyUnresolvedReferences
         return self._prediction_with_class_labels(
@@ -21,7 +21,6 @@ from lightgbm.sklearn import LGBMClassifier
 log = logging.getLogger(__name__)
 
 __all__ = ["LGBMClassifierDF"]
-__imported_estimators = {name for name in globals().keys() if name.endswith("DF")}
 
 
 #
@@ -52,21 +51,13 @@ class LGBMClassifierDF(ClassifierDF, LGBMClassifier):
 
 
 #
-# validate that __all__ comprises all symbols ending in "DF", and no others
+# validate that __all__ comprises all DF estimators defined above, and no others;
+# the estimators in this module are static, so we assert the literal set instead of
+# scanning dir() on every import (skipped when running with python -O)
 #
 
-__estimators = [
-    sym
-    for sym in dir()
-    if sym.endswith("DF")
-    and sym not in __imported_estimators
-    and not sym.startswith("_")
-]
-if set(__estimators) != set(__all__):
-    raise RuntimeError(
-        "__all__ does not contain exactly all DF estimators; expected value is:\n"
-        f"{__estimators}"
-    )
+if __debug__:
+    assert set(__all__) == {"LGBMClassifierDF"}
 
 
 __tracker.validate()
@@ -38,13 +38,15 @@ class _NDArrayTransformerWrapperDF(
 
     # noinspection PyPep8Naming
     def _convert_X_for_delegate(self, X: pd.DataFrame) -> Any:
-        return super()._convert_X_for_delegate(X).values
+        # use to_numpy(copy=False) so the delegate gets a view on the underlying
+        # data where possible, instead of the copy .values may create
+        return super()._convert_X_for_delegate(X).to_numpy(copy=False)
 
     def _convert_y_for_delegate(
         self, y: Optional[Union[pd.Series, pd.DataFrame]]
     ) -> Any:
         y = super()._convert_y_for_delegate(y)
-        return None if y is None else y.values
+        return None if y is None else y.to_numpy(copy=False)
 
 
 class _ColumnSubsetTransformerWrapperDF(
@@ -84,6 +84,7 @@ class OutlierRemoverDF(TransformerDF, BaseEstimator):
         self.threshold_low_ = q1 - threshold_iqr
         self.threshold_high_ = q3 + threshold_iqr
         self._features_original = X.columns.to_series()
+        self._features_out = None
         return self
 
     # noinspection PyPep8Naming
@@ -1,8 +1,10 @@
 # inspired by:
 # https://github.com/scikit-learn/scikit-learn/blob/master/sklearn/tests/test_base.py
+import pickle
 from abc import ABCMeta
 
 import numpy as np
+import pandas as pd
 
 # noinspection PyPackageRequirements
 import scipy.sparse as sp
@@ -11,6 +13,7 @@ from sklearn import clone
 from sklearn.base import BaseEstimator, is_classifier
 from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
 
 import sklearndf
 from sklearndf import EstimatorDF
@@ -19,7 +22,8 @@ from sklearndf import EstimatorDF
 from sklearndf._wrapper import _EstimatorWrapperDF, df_estimator
 from sklearndf.classification import SVCDF, DecisionTreeClassifierDF
 from sklearndf.pipeline import PipelineDF
-from sklearndf.transformation import OneHotEncoderDF
+from sklearndf.transformation import OneHotEncoderDF, StandardScalerDF
+from sklearndf.transformation.extra import OutlierRemoverDF
 
 
 class _DummyEstimator(BaseEstimator):
@@ -195,3 +199,50 @@ def test_set_params_updates_valid_params() -> None:
     # noinspection PyTypeChecker
     gs.set_params(estimator=SVCDF(), estimator__C=42.0)
     assert gs.estimator.C == 42.0
+
+
+def test_feature_names_out_invalidated_on_refit() -> None:
+    # Check that the cached output column index does not survive refitting a
+    # transformer on a data frame with different columns
+
+    df_ab = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    df_cd = pd.DataFrame({"c": [1.0, 2.0, 3.0], "d": [4.0, 5.0, 6.0]})
+
+    # wrapped transformers invalidate the cache via _reset_fit
+    scaler = StandardScalerDF()
+    scaler.fit(df_ab)
+    assert scaler.feature_names_out_.tolist() == ["a", "b"]
+    scaler.fit(df_cd)
+    assert scaler.feature_names_out_.tolist() == ["c", "d"]
+
+    # OutlierRemoverDF refits without going through _reset_fit, so it must
+    # invalidate the cache itself
+    outlier_remover = OutlierRemoverDF()
+    outlier_remover.fit(df_ab)
+    assert outlier_remover.feature_names_out_.tolist() == ["a", "b"]
+    outlier_remover.fit(df_cd)
+    assert outlier_remover.feature_names_out_.tolist() == ["c", "d"]
+
+
+def test_from_fitted_pickling() -> None:
+    # Check that wrappers built from a pre-fitted native estimator are instances
+    # of the public wrapper class itself, so they pickle by reference
+
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    native_scaler = StandardScaler().fit(df.values)
+
+    scaler_df = StandardScalerDF.from_fitted(
+        estimator=native_scaler, features_in=df.columns, n_outputs=0
+    )
+
+    assert type(scaler_df) is StandardScalerDF
+    assert scaler_df.is_fitted
+
+    scaler_df_unpickled = pickle.loads(pickle.dumps(scaler_df))
+
+    assert type(scaler_df_unpickled) is StandardScalerDF
+    assert scaler_df_unpickled.is_fitted
+    assert scaler_df_unpickled.feature_names_in_.tolist() == ["a", "b"]
+    assert_array_equal(
+        scaler_df_unpickled.transform(df).values, native_scaler.transform(df.values)
+    )